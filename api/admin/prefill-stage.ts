@@ -15,7 +15,7 @@
 
 import type { VercelRequest, VercelResponse } from '@vercel/node';
 import { requireAdmin } from '../../lib/require-admin.js';
-import { getSeason } from '../../lib/publish.js';
+import { getSeason } from '../../lib/season.js';
 import { fetchPcsPage, PcsFetchError } from '../../lib/pcs-fetch.js';
 import {
   parsePcsStagePage,
@@ -26,6 +26,21 @@ import {
   pcsCombativeRidersUrl,
 } from '../../lib/pcs-parse.js';
 
+// Race-level combative-riders index per season, kept for the life of a warm
+// function instance: one tap per stage otherwise re-downloads and re-parses
+// the same season-wide page. A listed award doesn't change, so an index
+// that already names this stage's winner is reused; a stage not in it yet
+// (the award often lands later) always refetches.
+const combativeIndexBySeason = new Map<string, Map<number, string>>();
+
+async function combativeRiderIndex(season: string, stage: number): Promise<Map<number, string>> {
+  const cached = combativeIndexBySeason.get(season);
+  if (cached?.has(stage)) return cached;
+  const index = parsePcsCombativeRiders(await fetchPcsPage(pcsCombativeRidersUrl(season)));
+  combativeIndexBySeason.set(season, index);
+  return index;
+}
+
 export default async function handler(req: VercelRequest, res: VercelResponse) {
   if (req.method !== 'GET') {
     return res.status(405).json({ success: false, error: 'Method not allowed' });
@@ -42,7 +57,6 @@ export default async function handler(req: VercelRequest, res: VercelResponse) {
   const season = getSeason();
   const stageUrl = pcsStageUrl(season, stage);
   const complementaryUrl = pcsComplementaryUrl(season, stage);
-  const combativeUrl = pcsCombativeRidersUrl(season);
   const warnings: string[] = [];
 
   // All three pages start in parallel (wall time = one fetch), but the
@@ -50,7 +64,7 @@ export default async function handler(req: VercelRequest, res: VercelResponse) {
   // the admin shouldn't wait out the best-effort fetches to hear "blocked".
   const optionalPages = Promise.allSettled([
     fetchPcsPage(complementaryUrl).then(parsePcsComplementaryPage),
-    fetchPcsPage(combativeUrl).then(parsePcsCombativeRiders),
+    combativeRiderIndex(season, stage),
   ]);
 
   let stageHtml: string;
@@ -69,8 +83,11 @@ export default async function handler(req: VercelRequest, res: VercelResponse) {
     });
   }
 
-  const [complementary, combative] = await optionalPages;
+  // Parse before awaiting the best-effort pages: they keep downloading
+  // meanwhile, so the parse overlaps their network wait instead of
+  // following it.
   const stagePage = parsePcsStagePage(stageHtml);
+  const [complementary, combative] = await optionalPages;
   if (stagePage.is_ttt) {
     warnings.push('Ploegentijdrit: PCS heeft geen individuele top-20 — vul de uitslag handmatig in.');
   } else if (stagePage.top20.length === 0) {
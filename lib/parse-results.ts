@@ -53,13 +53,22 @@ function matchTokens(
   riders: Array<{ name: string; tokens: string[] }>,
   lineTokens: Set<string>
 ): string | null {
-  const hits = riders.filter((r) => r.tokens.every((t) => lineTokens.has(t)));
-  if (hits.length === 1) return hits[0].name;
-  if (hits.length > 1) {
-    const sorted = hits.slice().sort((a, b) => b.tokens.length - a.tokens.length);
-    if (sorted[0].tokens.length > sorted[1].tokens.length) return sorted[0].name;
+  // One pass: keep the longest hit and whether another hit ties it — no
+  // hit list, no sort, and riders shorter than the best so far are skipped
+  // before their tokens are checked.
+  let best: { name: string; tokens: string[] } | null = null;
+  let tie = false;
+  for (const rider of riders) {
+    if (best && rider.tokens.length < best.tokens.length) continue;
+    if (!rider.tokens.every((t) => lineTokens.has(t))) continue;
+    if (best && rider.tokens.length === best.tokens.length) {
+      tie = true;
+    } else {
+      best = rider;
+      tie = false;
+    }
   }
-  return null;
+  return best && !tie ? best.name : null;
 }
 
 /**
@@ -11,14 +11,35 @@
  *      e.g. a scraping-proxy endpoint — retry through it;
  *   3. otherwise fail with kind 'blocked' so callers can tell "PCS said no"
  *      apart from "PCS is down" and show the right message.
+ *
+ * Transient answers (429, 500, 502, 504) to the direct fetch are retried
+ * up to twice with backoff (honouring Retry-After) within a deadline, so
+ * one hiccup doesn't fail the whole run.
+ *
+ * Optional on-disk cache for scripts and local reruns: when
+ * PCS_FETCH_CACHE_DIR is set, responses are stored per URL, and a failed
+ * fetch falls back to an older cached 200. Pages of seasons before
+ * getSeason() are finished and kept for 30 days; the current season's
+ * pages (results still landing, the combative-riders page changing
+ * daily) and 404s (a page PCS hasn't published *yet*) for one hour.
+ * Never set it on Vercel: the prefill must see PCS's late updates.
  */
 
+import { createHash } from 'node:crypto';
+import { mkdirSync, readFileSync, writeFileSync } from 'node:fs';
+import { join } from 'node:path';
+import { getSeason } from './season.js';
+
 export type PcsFetchFailureKind = 'blocked' | 'http' | 'network';
 
 export class PcsFetchError extends Error {
   constructor(
     message: string,
-    public readonly kind: PcsFetchFailureKind
+    public readonly kind: PcsFetchFailureKind,
+    /** HTTP status, when PCS (or the proxy) answered at all. */
+    public readonly status?: number,
+    /** Parsed Retry-After header, when the answer carried one. */
+    public readonly retryAfterMs?: number
   ) {
     super(message);
     this.name = 'PcsFetchError';
@@ -55,6 +76,15 @@ function looksBlocked(status: number, body: string): boolean {
   );
 }
 
+/** Retry-After as delta-seconds or an HTTP date, in ms from now. */
+function parseRetryAfter(header: string | null): number | undefined {
+  if (!header?.trim()) return undefined;
+  const seconds = Number(header);
+  if (Number.isFinite(seconds)) return Math.max(0, seconds * 1000);
+  const date = Date.parse(header);
+  return Number.isNaN(date) ? undefined : Math.max(0, date - Date.now());
+}
+
 async function fetchOnce(url: string, timeoutMs: number): Promise<string> {
   let response: Response;
   try {
@@ -73,29 +103,152 @@ async function fetchOnce(url: string, timeoutMs: number): Promise<string> {
   if (looksBlocked(response.status, body)) {
     throw new PcsFetchError(
       `PCS blokkeert dit verzoek (status ${response.status}, Cloudflare-challenge)`,
-      'blocked'
+      'blocked',
+      response.status
     );
   }
   if (!response.ok) {
     throw new PcsFetchError(
       `PCS antwoordde met status ${response.status} voor ${url}`,
-      'http'
+      'http',
+      response.status,
+      parseRetryAfter(response.headers.get('Retry-After'))
     );
   }
   return body;
 }
 
-export async function fetchPcsPage(
+// Transient answers worth another try: rate limiting and gateway hiccups.
+// 503 is not in here — from PCS that is Cloudflare (looksBlocked), which
+// a retry won't talk round. Timeouts aren't retried, and only the direct
+// leg retries at all, within a deadline of twice its timeout: worst case
+// 2 × 10 s direct + 30 s proxied stays inside the prefill's 60 s budget.
+const RETRY_STATUSES = new Set([429, 500, 502, 504]);
+const MAX_RETRIES = 2;
+const RETRY_BASE_DELAY_MS = 500;
+/** An attempt with less time than this left isn't worth starting. */
+const MIN_ATTEMPT_MS = 1_000;
+
+function isTransient(error: unknown): error is PcsFetchError {
+  return (
+    error instanceof PcsFetchError &&
+    error.kind === 'http' &&
+    error.status !== undefined &&
+    RETRY_STATUSES.has(error.status)
+  );
+}
+
+/**
+ * fetchOnce, retried on transient statuses with exponential backoff +
+ * jitter (or the server's Retry-After, when longer). Every attempt and
+ * wait must fit before `deadline`; when the next one wouldn't, the last
+ * error is thrown instead.
+ */
+async function fetchWithRetry(
   url: string,
-  { timeoutMs = 10_000 }: { timeoutMs?: number } = {}
+  timeoutMs: number,
+  deadline: number
 ): Promise<string> {
+  for (let attempt = 0; ; attempt++) {
+    try {
+      return await fetchOnce(url, Math.min(timeoutMs, deadline - Date.now()));
+    } catch (error) {
+      if (attempt >= MAX_RETRIES || !isTransient(error)) throw error;
+      const backoffMs = RETRY_BASE_DELAY_MS * 2 ** attempt * (1 + Math.random() / 2);
+      const delayMs = Math.max(backoffMs, error.retryAfterMs ?? 0);
+      if (Date.now() + delayMs + MIN_ATTEMPT_MS > deadline) throw error;
+      await new Promise((resolve) => setTimeout(resolve, delayMs));
+    }
+  }
+}
+
+async function fetchDirectOrProxied(url: string, timeoutMs: number): Promise<string> {
   try {
-    return await fetchOnce(url, timeoutMs);
+    return await fetchWithRetry(url, timeoutMs, Date.now() + 2 * timeoutMs);
   } catch (error) {
     const proxyTemplate = process.env.PCS_FETCH_PROXY;
     const blocked = error instanceof PcsFetchError && error.kind === 'blocked';
     if (!proxyTemplate || !blocked) throw error;
     const proxied = proxyTemplate.replace('{url}', encodeURIComponent(url));
+    // Not retried: with its 30 s timeout a second attempt wouldn't fit.
     return await fetchOnce(proxied, Math.max(timeoutMs, 30_000));
   }
 }
+
+const FINISHED_SEASON_MAX_AGE_MS = 30 * 24 * 60 * 60 * 1000;
+const LIVE_MAX_AGE_MS = 60 * 60 * 1000;
+const SEASON_IN_URL = /\/tour-de-france\/(\d{4})\//;
+
+interface CachedPage {
+  url: string;
+  status: 200 | 404;
+  body: string;
+  fetched_at: number;
+}
+
+function cachePath(dir: string, url: string): string {
+  return join(dir, `${createHash('sha1').update(url).digest('hex')}.json`);
+}
+
+function readCache(dir: string, url: string): CachedPage | null {
+  try {
+    const entry = JSON.parse(readFileSync(cachePath(dir, url), 'utf8')) as CachedPage;
+    return entry.url === url ? entry : null;
+  } catch {
+    return null; // missing or unreadable — treat as a miss
+  }
+}
+
+function writeCache(dir: string, entry: CachedPage): void {
+  try {
+    mkdirSync(dir, { recursive: true });
+    writeFileSync(cachePath(dir, entry.url), JSON.stringify(entry));
+  } catch (error) {
+    console.error('[PCS fetch] cache write failed (non-fatal):', error);
+  }
+}
+
+function cacheMaxAgeMs(entry: CachedPage): number {
+  if (entry.status === 404) return LIVE_MAX_AGE_MS;
+  const season = SEASON_IN_URL.exec(entry.url)?.[1];
+  return season && Number(season) < Number(getSeason())
+    ? FINISHED_SEASON_MAX_AGE_MS
+    : LIVE_MAX_AGE_MS;
+}
+
+function cachedResult(entry: CachedPage): string {
+  if (entry.status === 404) {
+    throw new PcsFetchError(
+      `PCS antwoordde met status 404 voor ${entry.url} (uit cache)`,
+      'http',
+      404
+    );
+  }
+  return entry.body;
+}
+
+export async function fetchPcsPage(
+  url: string,
+  { timeoutMs = 10_000 }: { timeoutMs?: number } = {}
+): Promise<string> {
+  const cacheDir = process.env.PCS_FETCH_CACHE_DIR;
+  const cached = cacheDir ? readCache(cacheDir, url) : null;
+  if (cached && Date.now() - cached.fetched_at < cacheMaxAgeMs(cached)) {
+    return cachedResult(cached);
+  }
+
+  try {
+    const body = await fetchDirectOrProxied(url, timeoutMs);
+    if (cacheDir) writeCache(cacheDir, { url, status: 200, body, fetched_at: Date.now() });
+    return body;
+  } catch (error) {
+    const notFound = error instanceof PcsFetchError && error.status === 404;
+    if (cacheDir && notFound) {
+      writeCache(cacheDir, { url, status: 404, body: '', fetched_at: Date.now() });
+    } else if (cached?.status === 200) {
+      // Stale-if-error: an expired copy beats no page at all.
+      return cached.body;
+    }
+    throw error;
+  }
+}
@@ -52,8 +52,21 @@ export interface PcsStagePage {
   tabs_found: string[];
 }
 
-const ABANDON_STATUSES = new Set(['DNF', 'DNS', 'OTL', 'DSQ']);
-const RANK_HEADERS = ['RNK', 'POS', 'RESULT', '#'];
+const RANK_HEADERS = new Set(['RNK', 'POS', 'RESULT', '#']);
+
+// Patterns applied per table row / per anchor, compiled once here.
+const WHITESPACE_RUN = /\s+/g;
+/** Rank cell: a finishing rank (group 1) or a non-finisher status (group 2). */
+const RANK_CELL = /^(?:(\d+)|(DNF|DNS|OTL|DSQ))$/i;
+const RELEGATED_ROW = /relegated/i;
+const STAGE_HREF = /stage-(\d+)/;
+
+// PCS pages carry large inline scripts and styles we never read. Listing
+// them as block-text elements set to false makes the parser skip their
+// bodies instead of building text nodes for them.
+const PARSE_OPTIONS = {
+  blockTextElements: { script: false, noscript: false, style: false, pre: true },
+};
 
 export function pcsStageUrl(season: string, stage: number): string {
   return `https://www.procyclingstats.com/race/tour-de-france/${season}/stage-${stage}`;
@@ -68,51 +81,102 @@ export function pcsCombativeRidersUrl(season: string): string {
   return `https://www.procyclingstats.com/race/tour-de-france/${season}/results/comative-riders`;
 }
 
+function anchorHref(a: HTMLElement): string {
+  return (a.getAttribute('href') ?? '').replace(/^\//, '');
+}
+
+/** Normalized anchor label; null for empty and "view" links. */
+function anchorLabel(a: HTMLElement): string | null {
+  const text = a.text.replace(WHITESPACE_RUN, ' ').trim();
+  return text && text.toLowerCase() !== 'view' ? text : null;
+}
+
 function anchorText(el: HTMLElement, hrefPrefix: string): string | null {
   for (const a of el.querySelectorAll('a')) {
-    const href = (a.getAttribute('href') ?? '').replace(/^\//, '');
-    if (href.startsWith(hrefPrefix)) {
-      const text = a.text.replace(/\s+/g, ' ').trim();
-      if (text && text.toLowerCase() !== 'view') return text;
-    }
+    if (!anchorHref(a).startsWith(hrefPrefix)) continue;
+    const text = anchorLabel(a);
+    if (text) return text;
   }
   return null;
 }
 
+/** A result row's rider and team anchors, in one pass over its links. */
+function rowAnchors(tr: HTMLElement): { rider: string | null; team: string | null } {
+  let rider: string | null = null;
+  let team: string | null = null;
+  for (const a of tr.querySelectorAll('a')) {
+    const href = anchorHref(a);
+    if (!rider && href.startsWith('rider/')) {
+      rider = anchorLabel(a);
+    } else if (!team && href.startsWith('team/')) {
+      team = anchorLabel(a);
+    }
+    if (rider && team) break;
+  }
+  return { rider, team };
+}
+
 /** Index of the rank column in the table's header row, default 0. */
 function rankColumnIndex(table: HTMLElement): number {
   const headerCells = table.querySelectorAll('thead th');
   for (let i = 0; i < headerCells.length; i++) {
     const label = headerCells[i].text.trim().toUpperCase();
-    if (RANK_HEADERS.includes(label)) return i;
+    if (RANK_HEADERS.has(label)) return i;
   }
   return 0;
 }
 
+function childElements(el: HTMLElement, tagName: string): HTMLElement[] {
+  return el.childNodes.filter(
+    (node): node is HTMLElement => node instanceof HTMLElement && node.tagName === tagName
+  );
+}
+
 interface RawRow {
   rankText: string;
   rider: string | null;
   team: string | null;
 }
 
-function parseResultTable(table: HTMLElement): RawRow[] {
+/**
+ * A result table's rows, yielded lazily: callers that only need the top of
+ * a table (a classification leader) stop the walk there instead of
+ * materializing the whole peloton.
+ */
+function* resultRows(table: HTMLElement): Generator<RawRow> {
   const rankIdx = rankColumnIndex(table);
-  const body = table.querySelector('tbody') ?? table;
-  const rows: RawRow[] = [];
-  for (const tr of body.querySelectorAll('tr')) {
-    const cells = tr.querySelectorAll('td');
+  // Direct children only: a descendant query walks every cell's subtree
+  // (flags, spans, nested markup) once per row, and per table for rows.
+  const body = table.querySelector('tbody');
+  const trs = body ? childElements(body, 'TR') : table.querySelectorAll('tr');
+  for (const tr of trs) {
+    const cells = childElements(tr, 'TD');
     // Non-result rows the python package also drops: spacers and
     // "relegated from position X" annotations.
     if (cells.length === 0) continue;
     if (cells.length <= 2 && cells[0].text.trim() === '') continue;
-    if (/relegated/i.test(tr.text)) continue;
-    rows.push({
-      rankText: (cells[rankIdx]?.text ?? '').trim(),
-      rider: anchorText(tr, 'rider/'),
-      team: anchorText(tr, 'team/'),
-    });
+    // rawText: the keyword test needs no entity decoding of the whole row.
+    if (RELEGATED_ROW.test(tr.rawText)) continue;
+    yield { rankText: (cells[rankIdx]?.text ?? '').trim(), ...rowAnchors(tr) };
+  }
+}
+
+/** The tab nav links plus each `div.resTab` by data-id, from one walk each. */
+interface ResultTabs {
+  links: HTMLElement[];
+  divs: Map<string, HTMLElement>;
+}
+
+function resultTabs(root: HTMLElement): ResultTabs {
+  const current = root.querySelectorAll('ul.tabs.tabnav.resultTabs li a');
+  const links =
+    current.length > 0 ? current : root.querySelectorAll('ul.restabs li a'); // pre-2025 markup
+  const divs = new Map<string, HTMLElement>();
+  for (const div of root.querySelectorAll('div.resTab')) {
+    const dataId = div.getAttribute('data-id');
+    if (dataId && !divs.has(dataId)) divs.set(dataId, div);
   }
-  return rows;
+  return { links, divs };
 }
 
 /**
@@ -120,102 +184,101 @@ function parseResultTable(table: HTMLElement): RawRow[] {
  * data-id that names the matching `div.resTab`. Labels are matched on
  * substring (the python package's tab_mapping).
  */
-function classificationTable(
-  root: HTMLElement,
-  tabLinks: HTMLElement[],
-  keyword: string
-): HTMLElement | null {
-  for (const link of tabLinks) {
+function classificationTable(tabs: ResultTabs, keyword: string): HTMLElement | null {
+  for (const link of tabs.links) {
     if (!link.text.toUpperCase().includes(keyword)) continue;
     const dataId = link.getAttribute('data-id');
     if (!dataId) continue;
-    const tabDiv = root
-      .querySelectorAll('div.resTab')
-      .find((d) => d.getAttribute('data-id') === dataId);
-    const table = tabDiv?.querySelector('table.results');
+    const table = tabs.divs.get(dataId)?.querySelector('table.results');
     if (table) return table;
   }
   return null;
 }
 
-function tabNavLinks(root: HTMLElement): HTMLElement[] {
-  const current = root.querySelectorAll('ul.tabs.tabnav.resultTabs li a');
-  if (current.length > 0) return current;
-  return root.querySelectorAll('ul.restabs li a'); // pre-2025 markup
-}
-
-function classificationLeader(
-  root: HTMLElement,
-  tabLinks: HTMLElement[],
-  keyword: string
-): string | null {
-  const table = classificationTable(root, tabLinks, keyword);
+function classificationLeader(tabs: ResultTabs, keyword: string): string | null {
+  const table = classificationTable(tabs, keyword);
   if (!table) return null;
-  for (const row of parseResultTable(table)) {
+  for (const row of resultRows(table)) {
     if (row.rankText === '1' && row.rider) return row.rider;
   }
   return null;
 }
 
-/** "Race information" infolist value for a label ("Won how", …). */
-function stageInfoByLabel(root: HTMLElement, label: string): string | null {
+/**
+ * The "Race information" list: the list after its h4, else the first
+ * `ul.infolist` (pages whose heading we don't recognize). The h4 wins so
+ * another infolist earlier on the page can't be mistaken for it.
+ */
+function raceInfoList(root: HTMLElement): HTMLElement | null {
   for (const h4 of root.querySelectorAll('h4')) {
     if (h4.text.trim().toLowerCase() !== 'race information') continue;
     let sibling = h4.nextElementSibling;
     while (sibling && !(sibling.tagName === 'UL' || sibling.tagName === 'OL')) {
       sibling = sibling.nextElementSibling;
     }
-    if (!sibling) return null;
-    for (const li of sibling.querySelectorAll('li')) {
-      const text = li.structuredText.replace(/\s+/g, ' ').trim();
-      const match = new RegExp(`^${label}:?\\s*(.+)$`, 'i').exec(text);
-      if (match) return match[1].trim();
-    }
+    if (sibling) return sibling;
+  }
+  return root.querySelector('ul.infolist');
+}
+
+/** "Race information" infolist value for a label ("Won how", …). */
+function stageInfoByLabel(root: HTMLElement, label: string): string | null {
+  const list = raceInfoList(root);
+  if (!list) return null;
+  const labelPattern = new RegExp(`^${label}:?\\s*(.+)$`, 'i');
+  // Only the list's own items are serialized, never the whole document.
+  for (const li of childElements(list, 'LI')) {
+    const text = li.structuredText.replace(WHITESPACE_RUN, ' ').trim();
+    const match = labelPattern.exec(text);
+    if (match) return match[1].trim();
   }
   return null;
 }
 
 export function parsePcsStagePage(html: string): PcsStagePage {
-  const root = parse(html);
-  const tabLinks = tabNavLinks(root);
+  const root = parse(html, PARSE_OPTIONS);
+  // One walk for the tab nav and the tab divs, shared by all five tables.
+  const tabs = resultTabs(root);
 
   // Stage result table: via the STAGE tab, with the package's fallbacks.
   const stageTable =
-    classificationTable(root, tabLinks, 'STAGE') ??
+    classificationTable(tabs, 'STAGE') ??
     root.querySelector('.resultCont .resTab table.results') ??
     root.querySelector('div.resTab table.results');
 
   const top20: PcsResultRow[] = [];
   const abandons: PcsAbandon[] = [];
-  for (const row of stageTable ? parseResultTable(stageTable) : []) {
+  for (const row of stageTable ? resultRows(stageTable) : []) {
     if (!row.rider) continue;
-    const status = row.rankText.toUpperCase();
-    if (/^\d+$/.test(row.rankText)) {
+    const rankMatch = RANK_CELL.exec(row.rankText);
+    if (!rankMatch) continue;
+    if (rankMatch[1]) {
       if (top20.length < 20) {
         top20.push({
           position: top20.length + 1,
-          rank: Number(row.rankText),
+          rank: Number(rankMatch[1]),
           rider: row.rider,
           team: row.team ?? '',
         });
       }
-    } else if (ABANDON_STATUSES.has(status)) {
-      abandons.push({ rider: row.rider, status: status as PcsAbandon['status'] });
+    } else {
+      const status = rankMatch[2].toUpperCase() as PcsAbandon['status'];
+      abandons.push({ rider: row.rider, status });
     }
   }
 
   return {
     top20,
     jerseys: {
-      yellow: classificationLeader(root, tabLinks, 'GC'),
-      green: classificationLeader(root, tabLinks, 'POINTS'),
-      polka_dot: classificationLeader(root, tabLinks, 'KOM'),
-      white: classificationLeader(root, tabLinks, 'YOUTH'),
+      yellow: classificationLeader(tabs, 'GC'),
+      green: classificationLeader(tabs, 'POINTS'),
+      polka_dot: classificationLeader(tabs, 'KOM'),
+      white: classificationLeader(tabs, 'YOUTH'),
     },
     abandons,
     won_how: stageInfoByLabel(root, 'Won how'),
     is_ttt: top20.length === 0 && root.querySelector('.ttt-results') !== null,
-    tabs_found: tabLinks.map((l) => l.text.trim()).filter(Boolean),
+    tabs_found: tabs.links.map((l) => l.text.trim()).filter(Boolean),
   };
 }
 
@@ -236,10 +299,10 @@ export interface PcsComplementaryPage {
  * mentions the team day classification, take the first team in its table.
  */
 export function parsePcsComplementaryPage(html: string): PcsComplementaryPage {
-  const root = parse(html);
+  const root = parse(html, PARSE_OPTIONS);
   const sections: Array<{ header: string; el: HTMLElement }> = [];
   for (const h of root.querySelectorAll('h2, h3, h4')) {
-    const header = h.text.replace(/\s+/g, ' ').trim();
+    const header = h.text.replace(WHITESPACE_RUN, ' ').trim();
     if (header) sections.push({ header, el: h });
   }
 
@@ -279,7 +342,7 @@ export function parsePcsComplementaryPage(html: string): PcsComplementaryPage {
  * Backup source for combativity when the complementary page lacks it.
  */
 export function parsePcsCombativeRiders(html: string): Map<number, string> {
-  const root = parse(html);
+  const root = parse(html, PARSE_OPTIONS);
   const byStage = new Map<number, string>();
   const table = root.querySelector('table.basic');
   if (!table) return byStage;
@@ -288,7 +351,7 @@ export function parsePcsCombativeRiders(html: string): Map<number, string> {
     const rider = anchorText(tr, 'rider/');
     if (!rider) continue;
     for (const a of tr.querySelectorAll('a')) {
-      const stageMatch = /stage-(\d+)/.exec(a.getAttribute('href') ?? '');
+      const stageMatch = STAGE_HREF.exec(a.getAttribute('href') ?? '');
       if (stageMatch) {
         byStage.set(Number(stageMatch[1]), rider);
         break;
@@ -104,11 +104,17 @@ export function buildPrefillPatch(
   }
   const matchDirect = createRiderMatcher(riderNames);
   const matchAlias = createRiderMatcher([...aliasToCanonical.keys()]);
+  // The same PCS names recur across top-20, jerseys, strijdlust and
+  // abandons; each lookup scans the whole rider list, so resolve once.
+  const resolved = new Map<string, string | null>();
   const resolveRider = (raw: string): string | null => {
+    const cached = resolved.get(raw);
+    if (cached !== undefined) return cached;
     const direct = matchDirect(raw);
-    if (direct) return direct;
-    const viaAlias = matchAlias(raw);
-    return viaAlias ? (aliasToCanonical.get(viaAlias) ?? null) : null;
+    const viaAlias = direct ? null : matchAlias(raw);
+    const match = direct ?? (viaAlias ? (aliasToCanonical.get(viaAlias) ?? null) : null);
+    resolved.set(raw, match);
+    return match;
   };
   const teamNames = [
     ...new Set(
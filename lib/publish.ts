@@ -16,6 +16,7 @@
  */
 
 import { put, list, del } from '@vercel/blob';
+import { getSeason } from './season.js';
 
 export const SNAPSHOT_FILES = [
   'metadata',
@@ -53,10 +54,6 @@ const IMMUTABLE_MAX_AGE = 31536000;
 /** Pointer must propagate fast (60s is the Vercel Blob minimum). */
 const POINTER_MAX_AGE = 60;
 
-export function getSeason(): string {
-  return process.env.SEASON || '2026';
-}
-
 function blobPrefix(): string {
   const env = process.env.VERCEL_ENV;
   return env && env !== 'production' ? 'preview/' : '';
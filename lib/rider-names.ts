@@ -25,8 +25,14 @@ const SPECIAL_FOLDS: Record<string, string> = {
   Ł: 'L',
 };
 
+const NON_ASCII = /[\u0080-\uffff]/;
+
 export function foldedRiderNameKey(name: string): string {
-  return riderNameKey(name)
+  const key = riderNameKey(name);
+  // Most names are plain ASCII already (DB + Excel spellings): nothing to
+  // decompose, so skip the NFD pass and the fold replaces entirely.
+  if (!NON_ASCII.test(key)) return key;
+  return key
     .normalize('NFD')
     .replace(/[̀-ͯ]/g, '') // combining diacritics
     .replace(/[ÆØĐÐÞẞŒŁ]/g, (ch) => SPECIAL_FOLDS[ch] ?? ch);
@@ -0,0 +1,9 @@
+/**
+ * The active season (year as a string), from SEASON with a 2026 default.
+ * Dependency-free so fetchers and parsers can use it without pulling in the
+ * publish pipeline.
+ */
+
+export function getSeason(): string {
+  return process.env.SEASON || '2026';
+}
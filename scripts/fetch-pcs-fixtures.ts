@@ -15,7 +15,7 @@ import { writeFileSync, mkdirSync } from 'node:fs';
 import { join, dirname } from 'node:path';
 import { fileURLToPath } from 'node:url';
 import { fetchPcsPage } from '../lib/pcs-fetch.js';
-import { getSeason } from '../lib/publish.js';
+import { getSeason } from '../lib/season.js';
 import {
   parsePcsStagePage,
   parsePcsComplementaryPage,
@@ -40,68 +40,105 @@ if (stages.length === 0) {
   process.exit(1);
 }
 
-async function capture(label: string, url: string, file: string): Promise<string | null> {
+/** PCS fetches in flight at once — parallel, but still polite to PCS. */
+const MAX_CONCURRENT_FETCHES = 4;
+/** Random delay before each fetch so the parallel requests don't burst. */
+const FETCH_JITTER_MS = 300;
+
+interface Capture {
+  html: string | null;
+  log: string;
+}
+
+async function capture(label: string, url: string, file: string): Promise<Capture> {
+  await new Promise((resolve) => setTimeout(resolve, Math.random() * FETCH_JITTER_MS));
   try {
     const html = await fetchPcsPage(url);
     writeFileSync(join(FIXTURE_DIR, file), html);
-    console.log(`✔ ${label}: ${html.length} bytes → tests/fixtures/pcs/${file}`);
-    return html;
+    const log = `✔ ${label}: ${html.length} bytes → tests/fixtures/pcs/${file}`;
+    return { html, log };
   } catch (error) {
-    console.error(`✘ ${label}: ${error instanceof Error ? error.message : error}`);
-    return null;
+    const log = `✘ ${label}: ${error instanceof Error ? error.message : error}`;
+    return { html: null, log };
   }
 }
 
+/** Run `fn` over `items` with at most `limit` calls in flight; keeps order. */
+async function mapWithConcurrency<T, R>(
+  items: T[],
+  limit: number,
+  fn: (item: T) => Promise<R>
+): Promise<R[]> {
+  const results = new Array<R>(items.length);
+  let next = 0;
+  const worker = async () => {
+    while (next < items.length) {
+      const i = next++;
+      results[i] = await fn(items[i]);
+    }
+  };
+  await Promise.all(Array.from({ length: Math.min(limit, items.length) }, worker));
+  return results;
+}
+
+function report(result: Capture, describe: (html: string) => string[]): void {
+  const print = result.html ? console.log : console.error;
+  print(result.log);
+  if (result.html) for (const line of describe(result.html)) console.log(line);
+}
+
+function describeStage(html: string): string[] {
+  const page = parsePcsStagePage(html);
+  return [
+    `  tabs: ${page.tabs_found.join(' | ')}`,
+    `  top-20: ${page.top20.length} rijen` +
+      (page.top20.length > 0 ? ` (1. ${page.top20[0].rider} — ${page.top20[0].team})` : ''),
+    `  truien: ${JSON.stringify(page.jerseys)}`,
+    `  opgaves: ${page.abandons.map((a) => `${a.rider} (${a.status})`).join(', ') || 'geen'}`,
+    `  won how: ${page.won_how ?? '—'}  TTT: ${page.is_ttt}`,
+  ];
+}
+
+function describeComplementary(html: string): string[] {
+  const comp = parsePcsComplementaryPage(html);
+  return [
+    `  secties: ${comp.sections_found.join(' | ') || 'GEEN'}`,
+    `  dagploeg: ${comp.team_day_winner ?? 'NIET GEVONDEN'}`,
+    `  strijdlust: ${comp.combativity ?? 'niet op deze pagina'}`,
+  ];
+}
+
+function describeCombative(html: string): string[] {
+  const byStage = parsePcsCombativeRiders(html);
+  return [
+    `  strijdlust per etappe: ${[...byStage.entries()].map(([s, r]) => `${s}: ${r}`).join(', ') || 'NIETS GEVONDEN'}`,
+  ];
+}
+
 async function main() {
   mkdirSync(FIXTURE_DIR, { recursive: true });
 
-  const combativeHtml = await capture(
-    'combative riders',
-    pcsCombativeRidersUrl(season),
-    'real-combative-riders.html'
+  // Every page is independent, so fetch them all up front (bounded) and
+  // report per stage afterwards — wall time ≈ slowest page, not the sum.
+  const pages: Array<[label: string, url: string, file: string]> = [
+    ['combative riders', pcsCombativeRidersUrl(season), 'real-combative-riders.html'],
+    ...stages.flatMap((stage): Array<[string, string, string]> => [
+      ['stage page', pcsStageUrl(season, stage), `real-stage-${stage}.html`],
+      ['complementary results', pcsComplementaryUrl(season, stage), `real-complementary-${stage}.html`],
+    ]),
+  ];
+  const [combative, ...perStage] = await mapWithConcurrency(
+    pages,
+    MAX_CONCURRENT_FETCHES,
+    ([label, url, file]) => capture(label, url, file)
   );
-  if (combativeHtml) {
-    const byStage = parsePcsCombativeRiders(combativeHtml);
-    console.log(
-      `  strijdlust per etappe: ${[...byStage.entries()].map(([s, r]) => `${s}: ${r}`).join(', ') || 'NIETS GEVONDEN'}`
-    );
-  }
 
-  for (const stage of stages) {
+  report(combative, describeCombative);
+  stages.forEach((stage, i) => {
     console.log(`\n=== Etappe ${stage} ===`);
-    const stageHtml = await capture(
-      'stage page',
-      pcsStageUrl(season, stage),
-      `real-stage-${stage}.html`
-    );
-    if (stageHtml) {
-      const page = parsePcsStagePage(stageHtml);
-      console.log(`  tabs: ${page.tabs_found.join(' | ')}`);
-      console.log(
-        `  top-20: ${page.top20.length} rijen` +
-          (page.top20.length > 0
-            ? ` (1. ${page.top20[0].rider} — ${page.top20[0].team})`
-            : '')
-      );
-      console.log(`  truien: ${JSON.stringify(page.jerseys)}`);
-      console.log(
-        `  opgaves: ${page.abandons.map((a) => `${a.rider} (${a.status})`).join(', ') || 'geen'}`
-      );
-      console.log(`  won how: ${page.won_how ?? '—'}  TTT: ${page.is_ttt}`);
-    }
-
-    const compHtml = await capture(
-      'complementary results',
-      pcsComplementaryUrl(season, stage),
-      `real-complementary-${stage}.html`
-    );
-    if (compHtml) {
-      const comp = parsePcsComplementaryPage(compHtml);
-      console.log(`  secties: ${comp.sections_found.join(' | ') || 'GEEN'}`);
-      console.log(`  dagploeg: ${comp.team_day_winner ?? 'NIET GEVONDEN'}`);
-      console.log(`  strijdlust: ${comp.combativity ?? 'niet op deze pagina'}`);
-    }
-  }
+    report(perStage[2 * i], describeStage);
+    report(perStage[2 * i + 1], describeComplementary);
+  });
 }
 
 main();
@@ -71,6 +71,16 @@ describe('parseResultsPaste', () => {
     expect(entries[0].matched).toBe(true);
   });
 
+  it('never guesses between equally long matches, whatever the list order', () => {
+    for (const riders of [
+      ['ADAM YATES', 'SIMON YATES', 'YATES'],
+      ['YATES', 'SIMON YATES', 'ADAM YATES'],
+    ]) {
+      const { entries } = parseResultsPaste('1. YATES Adam Simon', riders);
+      expect(entries[0].matched).toBe(false);
+    }
+  });
+
   it('keeps unrecognized rider lines in place instead of shifting positions', () => {
     const { entries, unmatched } = parseResultsPaste(
       'TADEJ POGACAR\n2. Piet Pataat\nJONAS VINGEGAARD',
@@ -0,0 +1,184 @@
+/**
+ * PCS fetcher tests: the on-disk cache and the transient-status retries.
+ * `fetch` is stubbed — no network; every test gets its own temp cache dir.
+ */
+
+import { afterEach, beforeEach, describe, expect, it, vi } from 'vitest';
+import { mkdtempSync, rmSync, writeFileSync } from 'node:fs';
+import { tmpdir } from 'node:os';
+import { join } from 'node:path';
+import { fetchPcsPage, PcsFetchError } from '../lib/pcs-fetch';
+
+const HOUR = 60 * 60 * 1000;
+const DAY = 24 * HOUR;
+const LIVE_URL = 'https://www.procyclingstats.com/race/tour-de-france/2026/stage-12';
+const PAST_URL = 'https://www.procyclingstats.com/race/tour-de-france/2025/stage-12';
+
+const page = (body: string, status = 200, headers: Record<string, string> = {}) =>
+  new Response(body, { status, headers });
+
+let cacheDir: string;
+let fetchMock: ReturnType<typeof vi.fn>;
+
+beforeEach(() => {
+  cacheDir = mkdtempSync(join(tmpdir(), 'pcs-cache-'));
+  vi.stubEnv('PCS_FETCH_CACHE_DIR', cacheDir);
+  vi.stubEnv('PCS_FETCH_PROXY', '');
+  vi.stubEnv('SEASON', '2026');
+  fetchMock = vi.fn();
+  vi.stubGlobal('fetch', fetchMock);
+  vi.useFakeTimers({ toFake: ['Date'] });
+  vi.setSystemTime(new Date('2026-07-16T18:00:00Z'));
+});
+
+afterEach(() => {
+  vi.useRealTimers();
+  vi.unstubAllGlobals();
+  vi.unstubAllEnvs();
+  vi.restoreAllMocks();
+  rmSync(cacheDir, { recursive: true, force: true });
+});
+
+describe('fetchPcsPage on-disk cache', () => {
+  it('serves a fresh copy without fetching again', async () => {
+    fetchMock.mockResolvedValueOnce(page('<html>stage</html>'));
+    expect(await fetchPcsPage(LIVE_URL)).toBe('<html>stage</html>');
+    vi.setSystemTime(Date.now() + 30 * 60 * 1000);
+    expect(await fetchPcsPage(LIVE_URL)).toBe('<html>stage</html>');
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+  });
+
+  it('refetches current-season pages after an hour', async () => {
+    fetchMock
+      .mockResolvedValueOnce(page('<html>before results</html>'))
+      .mockResolvedValueOnce(page('<html>with results</html>'));
+    await fetchPcsPage(LIVE_URL);
+    vi.setSystemTime(Date.now() + HOUR + 1);
+    expect(await fetchPcsPage(LIVE_URL)).toBe('<html>with results</html>');
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+  });
+
+  it('keeps pages of finished seasons for 30 days', async () => {
+    fetchMock
+      .mockResolvedValueOnce(page('<html>2025</html>'))
+      .mockResolvedValueOnce(page('<html>2025 refetched</html>'));
+    await fetchPcsPage(PAST_URL);
+    vi.setSystemTime(Date.now() + 29 * DAY);
+    expect(await fetchPcsPage(PAST_URL)).toBe('<html>2025</html>');
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+    vi.setSystemTime(Date.now() + 2 * DAY);
+    expect(await fetchPcsPage(PAST_URL)).toBe('<html>2025 refetched</html>');
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+  });
+
+  it('caches a 404 only for an hour — the page may be published later', async () => {
+    fetchMock
+      .mockResolvedValueOnce(page('not found', 404))
+      .mockResolvedValueOnce(page('<html>published</html>'));
+    await expect(fetchPcsPage(PAST_URL)).rejects.toMatchObject({ status: 404 });
+    await expect(fetchPcsPage(PAST_URL)).rejects.toThrow(/uit cache/);
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+    vi.setSystemTime(Date.now() + HOUR + 1);
+    expect(await fetchPcsPage(PAST_URL)).toBe('<html>published</html>');
+  });
+
+  it('falls back to an expired copy when the refetch fails', async () => {
+    fetchMock
+      .mockResolvedValueOnce(page('<html>old</html>'))
+      .mockRejectedValueOnce(new TypeError('fetch failed'));
+    await fetchPcsPage(LIVE_URL);
+    vi.setSystemTime(Date.now() + 2 * HOUR);
+    expect(await fetchPcsPage(LIVE_URL)).toBe('<html>old</html>');
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+  });
+
+  it('still fails when there is no copy to fall back to', async () => {
+    fetchMock.mockRejectedValueOnce(new TypeError('fetch failed'));
+    const error = await fetchPcsPage(LIVE_URL).catch((e: unknown) => e);
+    expect(error).toBeInstanceOf(PcsFetchError);
+    expect((error as PcsFetchError).kind).toBe('network');
+  });
+
+  it('returns the page when the cache write fails', async () => {
+    // A regular file where the cache dir should be: mkdir/write fail.
+    const blocker = join(cacheDir, 'not-a-dir');
+    writeFileSync(blocker, '');
+    vi.stubEnv('PCS_FETCH_CACHE_DIR', join(blocker, 'cache'));
+    const logged = vi.spyOn(console, 'error').mockImplementation(() => {});
+    fetchMock.mockResolvedValueOnce(page('<html>stage</html>'));
+    expect(await fetchPcsPage(LIVE_URL)).toBe('<html>stage</html>');
+    expect(logged).toHaveBeenCalledWith(
+      '[PCS fetch] cache write failed (non-fatal):',
+      expect.anything()
+    );
+  });
+});
+
+describe('fetchPcsPage retries', () => {
+  beforeEach(() => {
+    vi.stubEnv('PCS_FETCH_CACHE_DIR', '');
+    vi.useFakeTimers({ toFake: ['Date', 'setTimeout'] });
+  });
+
+  /** Run the fetch to completion, backoff timers included. */
+  const settle = async (url = LIVE_URL): Promise<unknown> => {
+    const result = fetchPcsPage(url).catch((e: unknown) => e);
+    await vi.runAllTimersAsync();
+    return result;
+  };
+
+  it('retries a transient status and returns the page', async () => {
+    fetchMock
+      .mockResolvedValueOnce(page('bad gateway', 502))
+      .mockResolvedValueOnce(page('<html>stage</html>'));
+    expect(await settle()).toBe('<html>stage</html>');
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+  });
+
+  it('gives up after two retries with the last error', async () => {
+    fetchMock.mockImplementation(async () => page('oops', 500));
+    const error = await settle();
+    expect(error).toBeInstanceOf(PcsFetchError);
+    expect((error as PcsFetchError).status).toBe(500);
+    expect(fetchMock).toHaveBeenCalledTimes(3);
+  });
+
+  it('does not retry a 404 or a Cloudflare block', async () => {
+    fetchMock.mockResolvedValueOnce(page('not found', 404));
+    expect(await settle()).toMatchObject({ status: 404 });
+    fetchMock.mockResolvedValueOnce(page('Just a moment...', 503));
+    expect(await settle()).toMatchObject({ kind: 'blocked' });
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+  });
+
+  it('waits out Retry-After on a 429', async () => {
+    fetchMock
+      .mockResolvedValueOnce(page('slow down', 429, { 'Retry-After': '5' }))
+      .mockResolvedValueOnce(page('<html>stage</html>'));
+    const result = fetchPcsPage(LIVE_URL);
+    await vi.advanceTimersByTimeAsync(4_000);
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+    await vi.advanceTimersByTimeAsync(1_500);
+    expect(await result).toBe('<html>stage</html>');
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+  });
+
+  it('fails at once when Retry-After is past the deadline', async () => {
+    fetchMock.mockResolvedValueOnce(page('slow down', 429, { 'Retry-After': '120' }));
+    expect(await fetchPcsPage(LIVE_URL).catch((e: unknown) => e)).toMatchObject({
+      status: 429,
+      retryAfterMs: 120_000,
+    });
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+  });
+
+  it('does not retry the proxied fetch', async () => {
+    vi.stubEnv('PCS_FETCH_PROXY', 'https://proxy.example/fetch?url={url}');
+    fetchMock
+      .mockResolvedValueOnce(page('Just a moment...', 403))
+      .mockImplementation(async () => page('proxy error', 502));
+    expect(await settle()).toMatchObject({ status: 502 });
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+    expect(fetchMock.mock.calls[1][0]).toMatch(/^https:\/\/proxy\.example\//);
+  });
+});
@@ -66,11 +66,52 @@ describe('parsePcsStagePage (synthetic fixture)', () => {
     expect(page.won_how).toBe('Sprint of small group');
   });
 
+  it('prefers the race information list over an earlier infolist', () => {
+    const other = parsePcsStagePage(
+      `<ul class="list infolist"><li><div>Won how:</div> <div>Wrong list</div></li></ul>
+       <h4>Race information</h4>
+       <ul class="list"><li><div>Won how:</div> <div>Solo breakaway</div></li></ul>`
+    );
+    expect(other.won_how).toBe('Solo breakaway');
+  });
+
+  it('falls back to ul.infolist when there is no race information heading', () => {
+    const headless = parsePcsStagePage(
+      `<ul class="list infolist"><li><div>Won how:</div> <div>Sprint of large group</div></li></ul>`
+    );
+    expect(headless.won_how).toBe('Sprint of large group');
+  });
+
+  it('falls back to ul.infolist when the heading has no list after it', () => {
+    const wrapped = parsePcsStagePage(
+      `<h4>Race information</h4>
+       <div class="wrapper">
+         <ul class="list infolist"><li><div>Won how:</div> <div>Solo breakaway</div></li></ul>
+       </div>`
+    );
+    expect(wrapped.won_how).toBe('Solo breakaway');
+  });
+
   it('reports the tabs it found for diagnostics', () => {
     expect(page.tabs_found).toEqual(['Stage', 'GC', 'Points', 'KOM', 'Youth', 'Teams']);
     expect(page.is_ttt).toBe(false);
   });
 
+  it('matches tab labels on substring, nested markup included', () => {
+    // .text joins nested element text without a space ("GCtime"), so the
+    // python package's substring match is what keeps this tab found.
+    const nested = parsePcsStagePage(
+      `<ul class="tabs tabnav resultTabs">
+         <li><a data-id="2">GC<span>time</span></a></li>
+       </ul>
+       <div class="resTab" data-id="2"><table class="results">
+         <thead><tr><th>Rnk</th><th>Rider</th></tr></thead>
+         <tbody><tr><td>1</td><td><a href="rider/a">AAA Aa</a></td></tr></tbody>
+       </table></div>`
+    );
+    expect(nested.jerseys.yellow).toBe('AAA Aa');
+  });
+
   it('carries PCS ranks so callers can detect a parsing gap', () => {
     const gappy = parsePcsStagePage(
       `<div class="resTab"><table class="results">
@@ -86,6 +127,33 @@ describe('parsePcsStagePage (synthetic fixture)', () => {
     ]);
   });
 
+  it('reads only a row\'s own cells, so nested markup cannot shift the rank column', () => {
+    const nested = parsePcsStagePage(
+      `<div class="resTab"><table class="results">
+         <thead><tr><th>BiB</th><th>Rnk</th><th>Rider</th></tr></thead>
+         <tbody>
+           <tr><td><table><tr><td>7</td><td>x</td></tr></table></td><td>1</td><td><a href="rider/a">AAA Aa</a></td></tr>
+           <tr><td>12</td><td>2</td><td><a href="rider/b">BBB Bb</a></td></tr>
+         </tbody></table></div>`
+    );
+    expect(nested.top20.map((r) => [r.position, r.rank, r.rider])).toEqual([
+      [1, 1, 'AAA Aa'],
+      [2, 2, 'BBB Bb'],
+    ]);
+  });
+
+  it('still reads result tables without a tbody', () => {
+    const bare = parsePcsStagePage(
+      `<div class="resTab"><table class="results">
+         <tr><th>Rnk</th><th>Rider</th></tr>
+         <tr><td>1</td><td><a href="rider/a">AAA Aa</a></td></tr>
+         <tr><td>DNF</td><td><a href="rider/b">BBB Bb</a></td></tr>
+       </table></div>`
+    );
+    expect(bare.top20.map((r) => r.rider)).toEqual(['AAA Aa']);
+    expect(bare.abandons).toEqual([{ rider: 'BBB Bb', status: 'DNF' }]);
+  });
+
   it('degrades to empty output on unrecognizable HTML, never throws', () => {
     const empty = parsePcsStagePage('<html><body><p>Just a moment...</p></body></html>');
     expect(empty.top20).toEqual([]);
@@ -0,0 +1,21 @@
+/**
+ * Rider-name key tests: the folded key must be identical whichever path a
+ * name takes (ASCII fast path or the NFD + special-fold path).
+ */
+
+import { describe, expect, it } from 'vitest';
+import { foldedRiderNameKey, riderNameKey } from '../lib/rider-names';
+
+describe('foldedRiderNameKey', () => {
+  it('returns the plain key for ASCII names', () => {
+    expect(foldedRiderNameKey('  Tadej   Pogacar ')).toBe('TADEJ POGACAR');
+    expect(foldedRiderNameKey('van der Poel Mathieu')).toBe(riderNameKey('van der Poel Mathieu'));
+  });
+
+  it('strips diacritics and applies the special folds', () => {
+    expect(foldedRiderNameKey('POGAČAR Tadej')).toBe('POGACAR TADEJ');
+    expect(foldedRiderNameKey('Grossschartner')).toBe(foldedRiderNameKey('Großschartner'));
+    expect(foldedRiderNameKey('Søren Wærenskjold')).toBe('SOREN WAERENSKJOLD');
+    expect(foldedRiderNameKey('Łukasz Owsian')).toBe('LUKASZ OWSIAN');
+  });
+});